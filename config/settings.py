@@ -13,6 +13,13 @@ GOOGLE_SHEETS_SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# API retry settings
+MAX_API_RETRIES = 6
+API_RETRY_DELAY = 1.0  # seconds, doubled on each retry
+API_MAX_RETRY_DELAY = 32.0
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503)
+RECORDS_CACHE_TTL = 5.0  # seconds a fetched transaction list is reused by read-only views
+
 # Worksheet settings
 TRANSACTIONS_WORKSHEET_NAME = 'Transactions'
 CHARTS_WORKSHEET_NAME = 'Charts & Analysis'
@@ -22,6 +29,7 @@ TRANSACTION_HEADERS = ["Date", "Description", "Category", "Amount", "Type", "Bal
 MAX_BALANCE_TREND_ENTRIES = 30
 CHARTS_WORKSHEET_ROWS = 50
 CHARTS_WORKSHEET_COLS = 10
+CHARTS_DATA_COLUMNS = 3
 
 # UI settings
 MENU_OPTIONS = {
@@ -1,9 +1,8 @@
 import gspread
 from google.oauth2.service_account import Credentials
-import pandas as pd
 from datetime import datetime, date
-import json
 import os
+from collections import defaultdict
 from tabulate import tabulate
 from colorama import Fore, Style, init
 
@@ -194,14 +193,11 @@ class FinanceTracker:
                     return
                 
                 # Calculate category totals
-                category_totals = {}
+                category_totals = defaultdict(lambda: {'income': 0, 'expense': 0})
                 for record in records:
                     category = record['Category']
                     amount = float(record['Amount'])
                     
-                    if category not in category_totals:
-                        category_totals[category] = {'income': 0, 'expense': 0}
-                    
                     if amount < 0:
                         category_totals[category]['expense'] += abs(amount)
                     else:
@@ -251,10 +247,19 @@ class FinanceTracker:
             except gspread.WorksheetNotFound:
                 charts_worksheet = self.spreadsheet.add_worksheet(title="Charts & Analysis", rows="50", cols="10")
             
-            # Prepare data for charts
-            self._create_category_summary_chart(charts_worksheet, records)
-            self._create_balance_trend_chart(charts_worksheet, records)
-            self._create_monthly_summary_chart(charts_worksheet, records)
+            # Prepare data for charts, parsing each amount once for every chart that needs it;
+            # a bad amount only skips the charts built from amounts, not the balance chart
+            amounts = self._parse_amounts(records)
+            chart_requests = [
+                amounts is not None and self._create_category_summary_chart(charts_worksheet, records, amounts),
+                self._create_balance_trend_chart(charts_worksheet, records),
+                amounts is not None and self._create_monthly_summary_chart(charts_worksheet, records, amounts)
+            ]
+            
+            # Add all charts in a single batch request
+            requests = [request for chart in chart_requests if chart for request in chart]
+            if requests:
+                self.spreadsheet.batch_update({'requests': requests})
             
             print(f"{Fore.GREEN}✅ Charts created successfully!")
             print(f"{Fore.CYAN}📈 Check the 'Charts & Analysis' tab in your spreadsheet")
@@ -264,31 +269,36 @@ class FinanceTracker:
             print(f"{Fore.RED}❌ Error creating charts: {str(e)}")
             return False
     
-    def _create_category_summary_chart(self, worksheet, records):
+    def _parse_amounts(self, records):
+        """Parse every record's amount, or return None if any of them is invalid"""
+        try:
+            return [float(record['Amount']) for record in records]
+        except Exception as e:
+            print(f"{Fore.YELLOW}⚠️  Could not create category and monthly charts: {str(e)}")
+            return None
+    
+    def _create_category_summary_chart(self, worksheet, records, amounts):
         """Create pie chart for expense categories"""
         try:
             # Calculate category expenses
-            category_expenses = {}
-            for record in records:
-                if float(record['Amount']) < 0:  # Only expenses
-                    category = record['Category']
-                    amount = abs(float(record['Amount']))
-                    category_expenses[category] = category_expenses.get(category, 0) + amount
+            category_expenses = defaultdict(float)
+            for record, amount in zip(records, amounts):
+                if amount < 0:  # Only expenses
+                    category_expenses[record['Category']] -= amount
             
             if not category_expenses:
                 return
             
             # Clear existing data and add new data
             worksheet.clear()
-            worksheet.update('A1', 'Category Expense Analysis')
-            worksheet.update('A3', 'Category')
-            worksheet.update('B3', 'Amount')
-            
-            row = 4
-            for category, amount in category_expenses.items():
-                worksheet.update(f'A{row}', category)
-                worksheet.update(f'B{row}', amount)
-                row += 1
+            block = [
+                ['Category Expense Analysis'],
+                [],
+                ['Category', 'Amount'],
+                *([category, amount] for category, amount in category_expenses.items())
+            ]
+            worksheet.update(f'A1:B{len(block)}', block)
+            row = len(block) + 1
                 
             # Create pie chart using Google Sheets API
             requests = [{
@@ -335,7 +345,7 @@ class FinanceTracker:
                 }
             }]
             
-            self.spreadsheet.batch_update({'requests': requests})
+            return requests
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create category chart: {str(e)}")
@@ -355,14 +365,8 @@ class FinanceTracker:
                 
             # Add balance trend data starting from row 15
             start_row = 15
-            worksheet.update(f'A{start_row}', 'Balance Trend Analysis')
-            worksheet.update(f'A{start_row + 2}', 'Date')
-            worksheet.update(f'B{start_row + 2}', 'Balance')
-            
-            for i, (date_str, balance) in enumerate(balance_data):
-                row = start_row + 3 + i
-                worksheet.update(f'A{row}', date_str)
-                worksheet.update(f'B{row}', balance)
+            block = [['Balance Trend Analysis'], [], ['Date', 'Balance'], *balance_data]
+            worksheet.update(f'A{start_row}:B{start_row + len(block) - 1}', block)
             
             end_row = start_row + 3 + len(balance_data)
             
@@ -427,44 +431,43 @@ class FinanceTracker:
                 }
             }]
             
-            self.spreadsheet.batch_update({'requests': requests})
+            return requests
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create balance trend chart: {str(e)}")
     
-    def _create_monthly_summary_chart(self, worksheet, records):
+    def _create_monthly_summary_chart(self, worksheet, records, amounts):
         """Create bar chart for monthly income vs expenses"""
         try:
-            # Calculate monthly data
-            monthly_data = {}
-            for record in records:
+            # Calculate monthly data in flat per-month totals, then merge them once
+            income = defaultdict(float)
+            expenses = defaultdict(float)
+            for record, amount in zip(records, amounts):
                 date_str = record['Date'][:7]  # YYYY-MM format
-                amount = float(record['Amount'])
-                
-                if date_str not in monthly_data:
-                    monthly_data[date_str] = {'income': 0, 'expenses': 0}
                 
                 if amount < 0:
-                    monthly_data[date_str]['expenses'] += abs(amount)
+                    expenses[date_str] -= amount
                 else:
-                    monthly_data[date_str]['income'] += amount
+                    income[date_str] += amount
+            
+            monthly_data = {
+                month: {'income': income[month], 'expenses': expenses[month]}
+                for month in income.keys() | expenses.keys()
+            }
             
             if not monthly_data:
                 return
                 
             # Add monthly summary starting from row 30
             start_row = 30
-            worksheet.update(f'A{start_row}', 'Monthly Income vs Expenses')
-            worksheet.update(f'A{start_row + 2}', 'Month')
-            worksheet.update(f'B{start_row + 2}', 'Income')
-            worksheet.update(f'C{start_row + 2}', 'Expenses')
-            
-            row = start_row + 3
-            for month, data in sorted(monthly_data.items()):
-                worksheet.update(f'A{row}', month)
-                worksheet.update(f'B{row}', data['income'])
-                worksheet.update(f'C{row}', data['expenses'])
-                row += 1
+            block = [
+                ['Monthly Income vs Expenses'],
+                [],
+                ['Month', 'Income', 'Expenses'],
+                *([month, data['income'], data['expenses']] for month, data in sorted(monthly_data.items()))
+            ]
+            worksheet.update(f'A{start_row}:C{start_row + len(block) - 1}', block)
+            row = start_row + len(block)
             
             # Create column chart
             requests = [{
@@ -543,7 +546,7 @@ class FinanceTracker:
                 }
             }]
             
-            self.spreadsheet.batch_update({'requests': requests})
+            return requests
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create monthly summary chart: {str(e)}")
@@ -2,8 +2,11 @@
 Modular Finance Tracker - Main Application Class
 """
 
+import operator
+import sys
+from collections import defaultdict
 from typing import List, Dict, Any
-from colorama import Fore, init
+from colorama import Fore, Style, init
 
 from models.transaction import Transaction
 from services.sheets_service import SheetsService
@@ -17,6 +20,13 @@ from config.settings import (
 # Initialize colorama
 init(autoreset=True)
 
+# Amount prefixes and net colors, indexed by whether the value is negative
+_AMOUNT_PREFIXES = (f"{Fore.GREEN}+$", f"{Fore.RED}-$")
+_NET_COLORS = (Fore.GREEN, Fore.RED)
+
+# Pulls a transaction record's displayed columns in table order with one call
+_ROW_GETTER = operator.itemgetter('Date', 'Description', 'Category', 'Amount', 'Type', 'Balance')
+
 
 class FinanceTracker:
     """
@@ -24,6 +34,8 @@ class FinanceTracker:
     Orchestrates all services and provides clean API
     """
     
+    DESCRIPTION_MAX_LENGTH = 30
+    
     def __init__(
         self,
         credentials_file: str = DEFAULT_CREDENTIALS_FILE,
@@ -47,8 +59,8 @@ class FinanceTracker:
             # Create transaction object
             transaction = Transaction(description, category, amount, transaction_type)
             
-            # Calculate balance
-            current_balance = self.get_current_balance()
+            # Calculate balance from the sheet, not the read cache, so rows added elsewhere are counted
+            current_balance = self.sheets_service.get_current_balance(use_cache=False)
             if transaction_type.lower() == 'expense':
                 new_balance = current_balance - abs(amount)
                 transaction.amount = -abs(amount)  # Ensure expenses are negative
@@ -141,60 +153,42 @@ class FinanceTracker:
     
     def _calculate_category_totals(self, records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
         """Calculate category totals for summary"""
-        category_totals = {}
+        category_totals = defaultdict(lambda: {'income': 0, 'expense': 0})
         
         for record in records:
-            category = record['Category']
             amount = float(record['Amount'])
-            
-            if category not in category_totals:
-                category_totals[category] = {'income': 0, 'expense': 0}
+            totals = category_totals[record['Category']]
             
             if amount < 0:
-                category_totals[category]['expense'] += abs(amount)
+                totals['expense'] -= amount
             else:
-                category_totals[category]['income'] += amount
+                totals['income'] += amount
         
-        return category_totals
+        return dict(category_totals)
     
     def _display_transactions(self, records: List[Dict[str, Any]], limit: int):
         """Display transactions in formatted table"""
-        if not records:
+        # Nothing to show for a non-positive limit or an empty sheet
+        if limit <= 0:
+            print(f"{Fore.YELLOW}⚠️  Please enter a number of transactions greater than 0.")
+            return
+        n = len(records)
+        if n == 0:
             print(f"{Fore.YELLOW}📝 No transactions found.")
             return
         
-        # Get recent records
-        recent_records = records[-limit:] if len(records) > limit else records
-        recent_records.reverse()  # Show most recent first
+        # Get recent records, most recent first, with one reverse slice (a copy, so the cached list is untouched)
+        recent_records = records[:-limit - 1:-1] if limit < n else records[::-1]
         
-        # Import here to avoid circular imports
-        from tabulate import tabulate
-        
-        # Format data for display
+        # Format data for display, one row per record
         headers = ["Date", "Description", "Category", "Amount", "Type", "Balance"]
-        table_data = []
-        
-        for record in recent_records:
-            amount = float(record['Amount'])
-            balance = float(record['Balance'])
-            
-            # Color code amounts
-            if amount < 0:
-                amount_str = f"{Fore.RED}-${abs(amount):.2f}"
-            else:
-                amount_str = f"{Fore.GREEN}+${amount:.2f}"
-            
-            table_data.append([
-                record['Date'],
-                self._truncate_text(record['Description'], 30),
-                record['Category'],
-                amount_str,
-                record['Type'],
-                f"${balance:.2f}"
-            ])
+        format_row = self._format_transaction_row
+        table_data = [format_row(record) for record in recent_records]
         
-        print(f"\n{Fore.CYAN}📊 Recent Transactions (Last {len(recent_records)}):")
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        # Emit header and table in one write (import here to avoid circular imports)
+        from tabulate import tabulate
+        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        sys.stdout.write(f"\n{Fore.CYAN}📊 Recent Transactions (Last {len(recent_records)}):{Style.RESET_ALL}\n{table}\n")
     
     def _display_category_summary(self, category_totals: Dict[str, Dict[str, float]]):
         """Display category summary in formatted table"""
@@ -202,32 +196,36 @@ class FinanceTracker:
             print(f"{Fore.YELLOW}📝 No transactions found.")
             return
         
-        # Import here to avoid circular imports
-        from tabulate import tabulate
-        
-        print(f"\n{Fore.CYAN}📈 Category Summary:")
         headers = ["Category", "Income", "Expenses", "Net"]
-        table_data = []
+        format_row = self._format_category_row
+        table_data = [format_row(category, totals) for category, totals in category_totals.items()]
         
-        for category, totals in category_totals.items():
-            income = totals['income']
-            expense = totals['expense']
-            net = income - expense
-            
-            net_color = Fore.GREEN if net >= 0 else Fore.RED
-            
-            table_data.append([
-                category,
-                f"{Fore.GREEN}${income:.2f}",
-                f"{Fore.RED}${expense:.2f}",
-                f"{net_color}${net:.2f}"
-            ])
+        # Emit header and table in one write (import here to avoid circular imports)
+        from tabulate import tabulate
+        table = tabulate(table_data, headers=headers, tablefmt="grid")
+        sys.stdout.write(f"\n{Fore.CYAN}📈 Category Summary:{Style.RESET_ALL}\n{table}\n")
+    
+    def _format_transaction_row(self, record: Dict[str, Any]) -> List[Any]:
+        """Format one transaction record for the transactions table"""
+        date, description, category, amount, kind, balance = _ROW_GETTER(record)
+        amount = float(amount)
         
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+        # Color code amounts
+        amount_str = f"{_AMOUNT_PREFIXES[amount < 0]}{abs(amount):.2f}"
+        return [date, self._truncate_text(description), category, amount_str, kind, f"${float(balance):.2f}"]
+    
+    @staticmethod
+    def _format_category_row(category: str, totals: Dict[str, float]) -> List[Any]:
+        """Format one category's income, expenses and net for the summary table"""
+        income = totals['income']
+        expense = totals['expense']
+        net = income - expense
+        return [category, f"{Fore.GREEN}${income:.2f}", f"{Fore.RED}${expense:.2f}", f"{_NET_COLORS[net < 0]}${net:.2f}"]
     
-    def _truncate_text(self, text: str, max_length: int) -> str:
+    def _truncate_text(self, text: str, max_length: int = DESCRIPTION_MAX_LENGTH) -> str:
         """Truncate text to maximum length"""
-        return text[:max_length] + "..." if len(text) > max_length else text
+        # An empty one-character slice past the limit means the text already fits
+        return f"{text[:max_length]}…" if text[max_length:max_length + 1] else text
     
     def get_stats(self) -> Dict[str, Any]:
         """Get financial statistics"""
@@ -242,8 +240,10 @@ class FinanceTracker:
                 'categories_count': 0
             }
         
-        total_income = sum(float(r['Amount']) for r in records if float(r['Amount']) > 0)
-        total_expenses = sum(abs(float(r['Amount'])) for r in records if float(r['Amount']) < 0)
+        # Parse each amount once instead of once per comparison and sum
+        amounts = [float(r['Amount']) for r in records]
+        total_income = sum(amount for amount in amounts if amount > 0)
+        total_expenses = sum(-amount for amount in amounts if amount < 0)
         categories = set(r['Category'] for r in records)
         
         return {
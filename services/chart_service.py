@@ -2,10 +2,19 @@
 Chart service for Finance Tracker
 """
 
-from typing import List, Dict, Any
+import hashlib
+import logging
+import re
+from typing import List, Dict, Any, Optional, Tuple
+import pandas as pd
 from colorama import Fore
 
-from config.settings import MAX_BALANCE_TREND_ENTRIES
+from config.settings import MAX_BALANCE_TREND_ENTRIES, CHARTS_DATA_COLUMNS, CHARTS_WORKSHEET_NAME
+
+logger = logging.getLogger(__name__)
+
+# Strips currency symbols, thousands separators and whitespace from amount strings
+_NUM_RE = re.compile(r'[^0-9.\-]')
 
 
 class ChartService:
@@ -13,6 +22,11 @@ class ChartService:
     
     def __init__(self, sheets_service):
         self.sheets_service = sheets_service
+        self._df: Optional[pd.DataFrame] = None
+        self._df_source: Optional[List[Dict[str, Any]]] = None
+        self._agg: Optional[tuple] = None
+        self._chart_ids: Dict[int, List[int]] = {}
+        self._last_digest: Optional[str] = None
     
     def create_all_charts(self, records: List[Dict[str, Any]]) -> bool:
         """Create all charts for the given transaction records"""
@@ -21,63 +35,127 @@ class ChartService:
                 print(f"{Fore.YELLOW}📝 No data available for charts")
                 return False
             
+            # Skip the rebuild when the charted data hasn't changed since the last successful run.
+            # The digest is process-local, so first confirm the tab and its charts weren't deleted elsewhere
+            digest = self._records_digest(records)
+            if digest == self._last_digest:
+                if self._charts_intact():
+                    print(f"{Fore.GREEN}✅ Charts are already up to date")
+                    return True
+                # Something was removed elsewhere, so find the charts to replace from the sheet itself
+                self._chart_ids.clear()
+            
+            # Compute every chart's data in one pass, before any Sheets call
+            category_expenses, balance_data, monthly_data = self._aggregate_all(records)
+            has_categories = bool(category_expenses)
+            has_trend = len(balance_data) >= 2
+            has_months = bool(monthly_data)
+            if not (has_categories or has_trend or has_months):
+                print(f"{Fore.YELLOW}📝 No data available for charts")
+                return False
+            
             print(f"{Fore.CYAN}📊 Creating charts...")
             
             # Get or create charts worksheet
-            charts_worksheet = self.sheets_service.get_or_create_charts_worksheet()
+            charts_worksheet, is_new = self.sheets_service.get_or_create_charts_worksheet()
+            
+            # Remove existing charts in the same batch that adds the new ones; a new tab has none
+            used_cached_ids = not is_new and charts_worksheet.id in self._chart_ids
+            delete_requests = [] if is_new else self._clear_existing_charts(charts_worksheet)
             
-            # Clear existing charts first
-            self._clear_existing_charts(charts_worksheet)
+            # Each builder returns its own (start_row, block, request), so concurrent refreshes share no state
+            charts = [
+                has_categories and self._create_category_pie_chart(charts_worksheet, category_expenses),
+                has_trend and self._create_balance_trend_chart(charts_worksheet, balance_data),
+                has_months and self._create_monthly_summary_chart(charts_worksheet, monthly_data)
+            ]
+            charts = [chart for chart in charts if chart]
+            add_requests = [request for _, _, request in charts]
             
-            # Create different types of charts
-            self._create_category_pie_chart(charts_worksheet, records)
-            self._create_balance_trend_chart(charts_worksheet, records)
-            self._create_monthly_summary_chart(charts_worksheet, records)
+            # Clear the sheet, write the chart data, delete old charts and add new ones in a single request
+            blocks = [(start_row, block) for start_row, block, _ in charts]
+            data_requests = [
+                {'updateCells': {'range': {'sheetId': charts_worksheet.id}, 'fields': 'userEnteredValue'}},
+                *self._build_data_requests(charts_worksheet, blocks)
+            ]
+            response = self.sheets_service.batch_update(data_requests + delete_requests + add_requests)
+            if response is None and used_cached_ids:
+                # A cached chart may have been deleted elsewhere, failing the whole batch;
+                # retry once with the charts the sheet actually has
+                print(f"{Fore.YELLOW}⚠️  Retrying with the current list of charts...")
+                self._chart_ids.pop(charts_worksheet.id, None)
+                delete_requests = self._clear_existing_charts(charts_worksheet)
+                response = self.sheets_service.batch_update(data_requests + delete_requests + add_requests)
+            if response is not None:
+                # Remember the new chart IDs so the next run can delete them without a metadata fetch
+                self._chart_ids[charts_worksheet.id] = [
+                    reply['addChart']['chart']['chartId']
+                    for reply in response.get('replies', [])
+                    if 'addChart' in reply
+                ]
+                self._last_digest = digest
+            else:
+                # Force a full rebuild next time instead of trusting state from before the failure;
+                # cached chart IDs may name charts deleted elsewhere, so re-read them from metadata
+                self._last_digest = None
+                self._chart_ids.pop(charts_worksheet.id, None)
+                return False
             
             print(f"{Fore.GREEN}✅ Charts created successfully!")
             print(f"{Fore.CYAN}📈 Check the 'Charts & Analysis' tab in your spreadsheet")
             return True
             
         except Exception as e:
+            self._last_digest = None
             print(f"{Fore.RED}❌ Error creating charts: {str(e)}")
             return False
     
-    def _create_category_pie_chart(self, worksheet, records: List[Dict[str, Any]]):
+    def _create_category_pie_chart(self, worksheet, category_expenses: Dict[str, float]) -> Optional[Tuple[int, List[List[Any]], Dict[str, Any]]]:
         """Create pie chart for expense categories"""
         try:
-            # Calculate category expenses
-            category_expenses = self._calculate_category_expenses(records)
-            
             if not category_expenses:
-                return
-            
-            # Clear and setup data
-            worksheet.clear()
-            worksheet.update('A1', 'Category Expense Analysis')
-            worksheet.update('A3', 'Category')
-            worksheet.update('B3', 'Amount')
+                return None
             
-            # Add data
-            row = 4
-            for category, amount in category_expenses.items():
-                worksheet.update(f'A{row}', category)
-                worksheet.update(f'B{row}', amount)
-                row += 1
+            # Setup data
+            block = [
+                ['Category Expense Analysis'],
+                [],
+                ['Category', 'Amount'],
+                *([category, amount] for category, amount in category_expenses.items())
+            ]
+            row = len(block) + 1
             
-            # Create chart
-            chart_request = self._build_pie_chart_request(worksheet.id, row)
-            self.sheets_service.batch_update([chart_request])
+            # Build chart request
+            return 1, block, self._build_pie_chart_request(worksheet.id, row)
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create category chart: {str(e)}")
+            return None
     
-    def _clear_existing_charts(self, worksheet):
-        """Clear all existing charts from the worksheet"""
+    def _charts_intact(self) -> bool:
+        """Check that the Charts tab and every chart added by the last run still exist"""
+        try:
+            spreadsheet_metadata = self.sheets_service.fetch_sheet_metadata()
+        except Exception:
+            logger.debug("Could not read existing charts", exc_info=True)
+            return False
+        
+        for sheet in spreadsheet_metadata['sheets']:
+            if sheet['properties']['title'] == CHARTS_WORKSHEET_NAME:
+                cached_ids = self._chart_ids.get(sheet['properties']['sheetId'])
+                existing_ids = {chart['chartId'] for chart in sheet.get('charts', [])}
+                return cached_ids is not None and existing_ids.issuperset(cached_ids)
+        return False
+    
+    def _clear_existing_charts(self, worksheet) -> List[Dict[str, Any]]:
+        """Build delete requests for all existing charts on the worksheet"""
+        if worksheet.id in self._chart_ids:
+            return [{'deleteEmbeddedObject': {'objectId': chart_id}} for chart_id in self._chart_ids[worksheet.id]]
+        
+        delete_requests = []
         try:
             # Get all charts in the spreadsheet
-            spreadsheet_metadata = self.sheets_service.spreadsheet.fetch_sheet_metadata()
-            
-            delete_requests = []
+            spreadsheet_metadata = self.sheets_service.fetch_sheet_metadata()
             
             # Find charts in our worksheet and prepare delete requests
             for sheet in spreadsheet_metadata['sheets']:
@@ -90,109 +168,146 @@ class ChartService:
                                 }
                             })
             
-            # Execute delete requests if any charts exist
-            if delete_requests:
-                self.sheets_service.batch_update(delete_requests)
-                
-        except Exception as e:
-            # If we can't delete existing charts, just continue
+        except Exception:
+            # If we can't read existing charts, just continue
             # This might happen if no charts exist yet
-            pass
+            logger.debug("Could not read existing charts", exc_info=True)
+        
+        return delete_requests
     
-    def _create_balance_trend_chart(self, worksheet, records: List[Dict[str, Any]]):
+    def _create_balance_trend_chart(self, worksheet, balance_data: List[tuple]) -> Optional[Tuple[int, List[List[Any]], Dict[str, Any]]]:
         """Create line chart for balance over time"""
         try:
-            # Prepare balance data
-            balance_data = self._prepare_balance_data(records)
-            
             if len(balance_data) < 2:
-                return
+                return None
             
             # Add data starting from row 15
             start_row = 15
-            worksheet.update(f'A{start_row}', 'Balance Trend Analysis')
-            worksheet.update(f'A{start_row + 2}', 'Date')
-            worksheet.update(f'B{start_row + 2}', 'Balance')
-            
-            for i, (date_str, balance) in enumerate(balance_data):
-                row = start_row + 3 + i
-                worksheet.update(f'A{row}', date_str)
-                worksheet.update(f'B{row}', balance)
-            
+            block = [
+                ['Balance Trend Analysis'],
+                [],
+                ['Date', 'Balance'],
+                *([date_str, balance] for date_str, balance in balance_data)
+            ]
             end_row = start_row + 3 + len(balance_data)
             
-            # Create chart
-            chart_request = self._build_line_chart_request(worksheet.id, start_row, end_row)
-            self.sheets_service.batch_update([chart_request])
+            # Build chart request
+            return start_row, block, self._build_line_chart_request(worksheet.id, start_row, end_row)
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create balance trend chart: {str(e)}")
+            return None
     
-    def _create_monthly_summary_chart(self, worksheet, records: List[Dict[str, Any]]):
+    def _create_monthly_summary_chart(self, worksheet, monthly_data: Dict[str, Dict[str, float]]) -> Optional[Tuple[int, List[List[Any]], Dict[str, Any]]]:
         """Create bar chart for monthly income vs expenses"""
         try:
-            # Calculate monthly data
-            monthly_data = self._calculate_monthly_data(records)
-            
             if not monthly_data:
-                return
+                return None
             
             # Add data starting from row 30
             start_row = 30
-            worksheet.update(f'A{start_row}', 'Monthly Income vs Expenses')
-            worksheet.update(f'A{start_row + 2}', 'Month')
-            worksheet.update(f'B{start_row + 2}', 'Income')
-            worksheet.update(f'C{start_row + 2}', 'Expenses')
+            block = [
+                ['Monthly Income vs Expenses'],
+                [],
+                ['Month', 'Income', 'Expenses'],
+                *([month, data['income'], data['expenses']] for month, data in monthly_data.items())
+            ]
+            row = start_row + len(block)
             
-            row = start_row + 3
-            for month, data in sorted(monthly_data.items()):
-                worksheet.update(f'A{row}', month)
-                worksheet.update(f'B{row}', data['income'])
-                worksheet.update(f'C{row}', data['expenses'])
-                row += 1
-            
-            # Create chart
-            chart_request = self._build_column_chart_request(worksheet.id, start_row, row)
-            self.sheets_service.batch_update([chart_request])
+            # Build chart request
+            return start_row, block, self._build_column_chart_request(worksheet.id, start_row, row)
             
         except Exception as e:
             print(f"{Fore.YELLOW}⚠️  Could not create monthly summary chart: {str(e)}")
+            return None
     
-    def _calculate_category_expenses(self, records: List[Dict[str, Any]]) -> Dict[str, float]:
-        """Calculate total expenses by category"""
-        category_expenses = {}
-        for record in records:
-            if float(record['Amount']) < 0:  # Only expenses
-                category = record['Category']
-                amount = abs(float(record['Amount']))
-                category_expenses[category] = category_expenses.get(category, 0) + amount
-        return category_expenses
+    def _build_data_requests(self, worksheet, blocks: List[Tuple[int, List[List[Any]]]]) -> List[Dict[str, Any]]:
+        """Build the requests that write the given blocks, growing the grid first if they don't fit"""
+        if not blocks:
+            return []
+        
+        extent = max(start_row + len(values) - 1 for start_row, values in blocks)
+        grid = [[''] * CHARTS_DATA_COLUMNS for _ in range(extent)]
+        for start_row, values in blocks:
+            for offset, row_values in enumerate(values):
+                grid[start_row - 1 + offset][:len(row_values)] = row_values
+        
+        # Typed cell values keep labels such as '2024-01' as text, unlike a CSV paste
+        requests = [{
+            'updateCells': {
+                'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+                'rows': [{'values': [self._cell_data(value) for value in row]} for row in grid],
+                'fields': 'userEnteredValue'
+            }
+        }]
+        
+        # A write past the last row would reject the whole batch, so grow the tab to fit the data
+        if extent > worksheet.row_count:
+            requests.insert(0, {
+                'updateSheetProperties': {
+                    'properties': {'sheetId': worksheet.id, 'gridProperties': {'rowCount': extent}},
+                    'fields': 'gridProperties.rowCount'
+                }
+            })
+        return requests
+    
+    @staticmethod
+    def _cell_data(value: Any) -> Dict[str, Any]:
+        """Convert a Python value into Sheets CellData; empty strings clear the cell"""
+        if value == '' or value is None:
+            return {}
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return {'userEnteredValue': {'numberValue': value}}
+        return {'userEnteredValue': {'stringValue': str(value)}}
+    
+    def _records_digest(self, records: List[Dict[str, Any]]) -> str:
+        """Hash the fields that feed the charts, in record order"""
+        payload = repr([
+            (r.get('Date'), r.get('Category'), r.get('Amount'), r.get('Balance'))
+            for r in records
+        ])
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
     
-    def _prepare_balance_data(self, records: List[Dict[str, Any]]) -> List[tuple]:
-        """Prepare balance trend data for charting"""
-        balance_data = []
-        for record in records[-MAX_BALANCE_TREND_ENTRIES:]:
-            date_str = record['Date'][:10]  # Just the date part
-            balance = float(record['Balance'])
-            balance_data.append((date_str, balance))
-        return balance_data
+    def _records_to_df(self, records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Load records into a DataFrame with numeric Amount/Balance columns, once per record list"""
+        if self._df is None or self._df_source is not records:
+            df = pd.DataFrame.from_records(records, columns=['Date', 'Category', 'Amount', 'Balance'])
+            df['Date'] = df['Date'].astype(str)
+            for column in ('Amount', 'Balance'):
+                # get_all_records already returns plain numbers; only clean formatted strings
+                if not pd.api.types.is_numeric_dtype(df[column]):
+                    cleaned = df[column].astype(str).str.replace(_NUM_RE, '', regex=True)
+                    df[column] = pd.to_numeric(cleaned, errors='coerce')
+            self._df = df
+            self._df_source = records
+        return self._df
     
-    def _calculate_monthly_data(self, records: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
-        """Calculate monthly income and expenses"""
-        monthly_data = {}
-        for record in records:
-            date_str = record['Date'][:7]  # YYYY-MM format
-            amount = float(record['Amount'])
+    def _aggregate_all(self, records: List[Dict[str, Any]]) -> Tuple[Dict[str, float], List[tuple], Dict[str, Dict[str, float]]]:
+        """Compute category expenses, balance trend and monthly totals from one parse of the records"""
+        if self._agg is None or self._df_source is not records:
+            df = self._records_to_df(records)
+            amounts = df['Amount']
+            expense_mask = amounts < 0
             
-            if date_str not in monthly_data:
-                monthly_data[date_str] = {'income': 0, 'expenses': 0}
+            # Category expenses
+            category_expenses = (-amounts[expense_mask].groupby(df['Category'][expense_mask], sort=False).sum()).to_dict()
             
-            if amount < 0:
-                monthly_data[date_str]['expenses'] += abs(amount)
-            else:
-                monthly_data[date_str]['income'] += amount
-        
-        return monthly_data
+            # Balance trend: slice the tail first (a view) so only those rows are filtered
+            tail = df.iloc[-MAX_BALANCE_TREND_ENTRIES:]
+            tail = tail.loc[tail['Balance'].notna()]
+            balance_data = list(zip(tail['Date'].str[:10].tolist(), tail['Balance'].tolist()))  # Just the date part
+            
+            # Monthly income and expenses
+            monthly = pd.DataFrame({
+                'income': amounts.where(amounts > 0, 0.0),
+                'expenses': (-amounts).where(expense_mask, 0.0)
+            }).groupby(df['Date'].str[:7], sort=False).sum()  # YYYY-MM format
+            if not monthly.index.is_monotonic_increasing:
+                # Date-ordered records already yield months in order; only sort otherwise
+                monthly = monthly.sort_index()
+            
+            self._agg = (category_expenses, balance_data, monthly.to_dict('index'))
+        return self._agg
     
     def _build_pie_chart_request(self, sheet_id: int, end_row: int) -> Dict[str, Any]:
         """Build pie chart request for Google Sheets API"""
@@ -2,10 +2,16 @@
 Google Sheets service for Finance Tracker
 """
 
+import logging
 import os
+import random
+import re
+import sys
+import time
 import gspread
+from functools import lru_cache
 from google.oauth2.service_account import Credentials
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from colorama import Fore
 
 from config.settings import (
@@ -14,9 +20,35 @@ from config.settings import (
     CHARTS_WORKSHEET_NAME, 
     TRANSACTION_HEADERS,
     CHARTS_WORKSHEET_ROWS,
-    CHARTS_WORKSHEET_COLS
+    CHARTS_WORKSHEET_COLS,
+    MAX_API_RETRIES,
+    API_RETRY_DELAY,
+    API_MAX_RETRY_DELAY,
+    RETRYABLE_STATUS_CODES,
+    RECORDS_CACHE_TTL
 )
 
+logger = logging.getLogger(__name__)
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore that yields empty strings"""
+    
+    def __getattr__(self, name: str) -> str:
+        return ''
+
+
+# Skip building ANSI color codes when output is redirected to a file or pipe
+if not sys.stdout.isatty():
+    Fore = _NoColor()
+
+
+@lru_cache(maxsize=4)
+def _authorize(credentials_file: str) -> gspread.Client:
+    """Load service account credentials and build an authorized client, once per credentials file"""
+    creds = Credentials.from_service_account_file(credentials_file, scopes=GOOGLE_SHEETS_SCOPES)
+    return gspread.authorize(creds)
+
 
 class SheetsService:
     """Handles all Google Sheets operations"""
@@ -28,6 +60,10 @@ class SheetsService:
         self.client = None
         self.spreadsheet = None
         self.transactions_worksheet = None
+        self._records_cache: Optional[List[Dict[str, Any]]] = None
+        self._records_cache_ts = 0.0
+        self._last_row: Optional[int] = None  # Sheet row of this process's latest append
+        self._last_row_ts = 0.0
         
     def connect(self) -> bool:
         """Connect to Google Sheets API"""
@@ -36,9 +72,8 @@ class SheetsService:
                 print(f"{Fore.RED}❌ Credentials file '{self.credentials_file}' not found!")
                 return False
                 
-            # Load credentials
-            creds = Credentials.from_service_account_file(self.credentials_file, scopes=GOOGLE_SHEETS_SCOPES)
-            self.client = gspread.authorize(creds)
+            # Load credentials and authorize (reused across instances for the same file)
+            self.client = _authorize(self.credentials_file)
             
             # Open or create spreadsheet
             self._setup_spreadsheet()
@@ -87,9 +122,16 @@ class SheetsService:
     
     def add_transaction_row(self, transaction_row: List[Any]) -> bool:
         """Add a transaction row to the spreadsheet"""
+        return self.add_transaction_rows([transaction_row])
+    
+    def add_transaction_rows(self, transaction_rows: List[List[Any]]) -> bool:
+        """Add several transaction rows to the spreadsheet in a single append"""
         try:
             if self.transactions_worksheet:
-                self.transactions_worksheet.append_row(transaction_row)
+                response = self.transactions_worksheet.append_rows(transaction_rows)
+                self._records_cache = None
+                self._last_row = self._row_from_range(response.get('updates', {}).get('updatedRange', ''))
+                self._last_row_ts = time.monotonic()
                 return True
             return False
         except Exception as e:
@@ -100,17 +142,41 @@ class SheetsService:
         """Get all transactions from spreadsheet"""
         try:
             if self.transactions_worksheet:
-                return self.transactions_worksheet.get_all_records()
+                records = self._cached_records()
+                if records is None:
+                    records = self._retry_api_call(self.transactions_worksheet.get_all_records)
+                    self._records_cache = records
+                    self._records_cache_ts = time.monotonic()
+                return records
             return []
         except Exception as e:
             print(f"{Fore.RED}❌ Error fetching transactions: {str(e)}")
             return []
     
-    def get_current_balance(self) -> float:
-        """Get current balance from last transaction"""
+    def _cached_records(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached transaction records while they are still fresh"""
+        if self._records_cache is not None and time.monotonic() - self._records_cache_ts <= RECORDS_CACHE_TTL:
+            return self._records_cache
+        return None
+    
+    def get_current_balance(self, use_cache: bool = True) -> float:
+        """Get current balance from last transaction; pass use_cache=False when the balance feeds a write"""
         try:
             if self.transactions_worksheet:
-                balance_column = self.transactions_worksheet.col_values(6)  # Column F (Balance)
+                # Reuse a fresh records fetch instead of reading the Balance column again
+                records = self._cached_records() if use_cache else None
+                if records:
+                    last_balance = records[-1]['Balance']
+                    return float(last_balance) if last_balance != '' else 0.0
+                
+                # Right after our own append, read just that row's Balance cell; a write skips this
+                # shortcut too, since another client may have appended after us
+                last_row = self._recent_append_row() if use_cache else None
+                if last_row is not None:
+                    last_balance = self._retry_api_call(self.transactions_worksheet.acell, f'F{last_row}').value
+                    return float(last_balance) if last_balance else 0.0
+                
+                balance_column = self._retry_api_call(self.transactions_worksheet.col_values, 6)  # Column F (Balance)
                 if len(balance_column) > 1:  # Skip header
                     last_balance = balance_column[-1]
                     return float(last_balance) if last_balance else 0.0
@@ -118,25 +184,62 @@ class SheetsService:
         except:
             return 0.0
     
-    def get_or_create_charts_worksheet(self):
-        """Get or create charts worksheet"""
+    def _recent_append_row(self) -> Optional[int]:
+        """Return the row of this process's latest append while it is still fresh"""
+        # Other clients may append after us, so the row is only trusted as long as cached records are
+        if self._last_row is not None and time.monotonic() - self._last_row_ts <= RECORDS_CACHE_TTL:
+            return self._last_row
+        return None
+    
+    @staticmethod
+    def _row_from_range(a1_range: str) -> Optional[int]:
+        """Extract the last row number from an A1 range such as 'Transactions!A5:F5'"""
+        match = re.search(r'(\d+)$', a1_range)
+        return int(match.group(1)) if match else None
+    
+    def get_or_create_charts_worksheet(self) -> Tuple[gspread.Worksheet, bool]:
+        """Get or create charts worksheet, returning (worksheet, is_new)"""
         try:
-            return self.spreadsheet.worksheet(CHARTS_WORKSHEET_NAME)
+            return self.spreadsheet.worksheet(CHARTS_WORKSHEET_NAME), False
         except gspread.WorksheetNotFound:
             return self.spreadsheet.add_worksheet(
                 title=CHARTS_WORKSHEET_NAME, 
                 rows=CHARTS_WORKSHEET_ROWS, 
                 cols=CHARTS_WORKSHEET_COLS
-            )
+            ), True
     
-    def batch_update(self, requests: List[Dict[str, Any]]) -> bool:
-        """Perform batch update on spreadsheet"""
+    def fetch_sheet_metadata(self) -> Dict[str, Any]:
+        """Fetch spreadsheet metadata, including embedded charts"""
+        return self._retry_api_call(self.spreadsheet.fetch_sheet_metadata)
+    
+    def batch_update(self, requests: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Perform batch update on spreadsheet, returning the API response or None on failure"""
         try:
-            self.spreadsheet.batch_update({'requests': requests})
-            return True
+            return self._retry_api_call(self.spreadsheet.batch_update, {'requests': requests})
         except Exception as e:
             print(f"{Fore.RED}❌ Error in batch update: {str(e)}")
-            return False
+            return None
+    
+    def _retry_api_call(self, func: Callable, *args, **kwargs):
+        """Call a Sheets API function, retrying rate-limit and server errors with backoff"""
+        for attempt in range(MAX_API_RETRIES):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                status = e.response.status_code
+                if status not in RETRYABLE_STATUS_CODES or attempt == MAX_API_RETRIES - 1:
+                    raise
+                
+                # Honour the server's Retry-After hint, otherwise back off exponentially
+                retry_after = e.response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = float(retry_after)
+                else:
+                    delay = min(API_MAX_RETRY_DELAY, API_RETRY_DELAY * 2 ** attempt)
+                delay += random.uniform(0, 0.5)
+                logger.warning("Sheets API returned %s, retrying in %.1fs (attempt %d of %d)",
+                               status, delay, attempt + 1, MAX_API_RETRIES - 1)
+                time.sleep(delay)
     
     def is_connected(self) -> bool:
         """Check if service is properly connected"""
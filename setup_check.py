@@ -4,35 +4,46 @@ This script helps verify that your Google Sheets API setup is working correctly.
 """
 
 import os
+import sys
 import json
+from importlib.util import find_spec
 from colorama import Fore, Style, init
 
 # Initialize colorama
 init(autoreset=True)
 
+# Fields every service account key file must contain
+REQUIRED_CREDENTIAL_FIELDS = ('type', 'project_id', 'private_key_id', 'private_key',
+                              'client_email', 'client_id', 'auth_uri', 'token_uri')
+
+# Import names for packages whose module name differs from the distribution name
+PACKAGE_MODULES = {
+    'google-auth': 'google.auth',
+    'google-auth-oauthlib': 'google_auth_oauthlib'
+}
+
 def check_credentials_file():
     """Check if credentials.json exists and is valid"""
     print(f"{Fore.CYAN}🔍 Checking credentials file...")
     
     if not os.path.exists('credentials.json'):
-        print(f"{Fore.RED}❌ credentials.json not found!")
-        print(f"{Fore.YELLOW}📝 Please follow these steps:")
-        print("   1. Go to Google Cloud Console (https://console.cloud.google.com/)")
-        print("   2. Create a new project or select existing one")
-        print("   3. Enable Google Sheets API and Google Drive API")
-        print("   4. Create Service Account credentials")
-        print("   5. Download the JSON file and rename it to 'credentials.json'")
-        print("   6. Place it in this project directory")
+        sys.stdout.write(
+            f"{Fore.RED}❌ credentials.json not found!{Style.RESET_ALL}\n"
+            f"{Fore.YELLOW}📝 Please follow these steps:{Style.RESET_ALL}\n"
+            "   1. Go to Google Cloud Console (https://console.cloud.google.com/)\n"
+            "   2. Create a new project or select existing one\n"
+            "   3. Enable Google Sheets API and Google Drive API\n"
+            "   4. Create Service Account credentials\n"
+            "   5. Download the JSON file and rename it to 'credentials.json'\n"
+            "   6. Place it in this project directory\n"
+        )
         return False
     
     try:
         with open('credentials.json', 'r') as f:
             creds = json.load(f)
         
-        required_fields = ['type', 'project_id', 'private_key_id', 'private_key', 
-                          'client_email', 'client_id', 'auth_uri', 'token_uri']
-        
-        missing_fields = [field for field in required_fields if field not in creds]
+        missing_fields = [field for field in REQUIRED_CREDENTIAL_FIELDS if field not in creds]
         
         if missing_fields:
             print(f"{Fore.RED}❌ credentials.json is missing required fields: {missing_fields}")
@@ -66,10 +77,16 @@ def check_dependencies():
     missing_packages = []
     
     for package in required_packages:
+        # Only locate the module; importing it would fully initialise heavy packages like pandas
+        module_name = PACKAGE_MODULES.get(package, package.replace('-', '_'))
         try:
-            __import__(package.replace('-', '_'))
-            print(f"{Fore.GREEN}✅ {package}")
+            found = find_spec(module_name) is not None
         except ImportError:
+            found = False
+        
+        if found:
+            print(f"{Fore.GREEN}✅ {package}")
+        else:
             print(f"{Fore.RED}❌ {package}")
             missing_packages.append(package)
     
@@ -135,8 +152,7 @@ def test_google_sheets_connection():
 
 def main():
     """Main setup check function"""
-    print(f"{Fore.CYAN}🛠️  Finance Tracker Setup Check")
-    print(f"{Fore.CYAN}=" * 40)
+    sys.stdout.write(f"{Fore.CYAN}🛠️  Finance Tracker Setup Check\n{'=' * 40}{Style.RESET_ALL}\n")
     
     all_good = True
     
@@ -155,16 +171,20 @@ def main():
     else:
         all_good = False
     
-    print(f"\n{Fore.CYAN}📋 Setup Check Results:")
-    print("=" * 30)
-    
+    # Build the results summary and emit it in one write
+    lines = [f"\n{Fore.CYAN}📋 Setup Check Results:{Style.RESET_ALL}", "=" * 30]
     if all_good:
-        print(f"{Fore.GREEN}🎉 Everything looks great! You're ready to use the Finance Tracker!")
-        print(f"\n{Fore.CYAN}🚀 Run the application with:")
-        print(f"{Fore.WHITE}python finance_tracker.py")
+        lines += [
+            f"{Fore.GREEN}🎉 Everything looks great! You're ready to use the Finance Tracker!{Style.RESET_ALL}",
+            f"\n{Fore.CYAN}🚀 Run the application with:{Style.RESET_ALL}",
+            f"{Fore.WHITE}python finance_tracker.py{Style.RESET_ALL}"
+        ]
     else:
-        print(f"{Fore.RED}❌ Some issues were found. Please fix them before running the Finance Tracker.")
-        print(f"\n{Fore.YELLOW}📖 Check the README.md for detailed setup instructions.")
+        lines += [
+            f"{Fore.RED}❌ Some issues were found. Please fix them before running the Finance Tracker.{Style.RESET_ALL}",
+            f"\n{Fore.YELLOW}📖 Check the README.md for detailed setup instructions.{Style.RESET_ALL}"
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file